@@ -13,8 +13,8 @@ How to run locally
 1) Create a virtual env and install deps:  
    pip install fastapi uvicorn pydantic[dotenv] python-multipart
 
-2) Run the server:  
-   uvicorn app:app --host 0.0.0.0 --port 8000
+2) Run the server:
+   uvicorn app:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 
 3) Open docs at: http://localhost:8000/docs
 
@@ -33,14 +33,28 @@ License: MIT (adjust as you prefer).
 """
 from __future__ import annotations
 
+import functools
+import hmac
 import os
 import random
 import re
-from typing import List, Literal, Optional
+from types import MappingProxyType
+from typing import Callable, List, Literal, Optional, Sequence, get_args
 
-from fastapi import FastAPI, Header, HTTPException, Depends, Query
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
+# uvloop (bundled with uvicorn[standard]) is a drop-in, C-implemented event
+# loop; install it up front so every server picks it up regardless of flags.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 # -----------------------------
 # App metadata (shows up in docs)
 # -----------------------------
@@ -55,6 +69,7 @@ app = FastAPI(
     title=API_TITLE,
     description=API_DESCRIPTION,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Ashik Sharon M",
         "url": "https://corporate-buzzword-generator-api.onrender.com",  # replace before publishing
@@ -71,19 +86,33 @@ app = FastAPI(
 # -----------------------------
 PROXY_SECRET = os.getenv("PROXY_SECRET")
 
+# Endpoints reachable without the proxy secret (docs + liveness).
+_OPEN_PATHS = frozenset({"/", "/health", "/docs", "/redoc", "/openapi.json"})
+
 
-def require_proxy_secret(x_rapidapi_proxy_secret: Optional[str] = Header(default=None, alias="X-RapidAPI-Proxy-Secret")):
+@app.middleware("http")
+async def require_proxy_secret(request: Request, call_next):
     """Require the RapidAPI proxy secret if PROXY_SECRET is set.
 
     When you publish on RapidAPI, under *Security* tab you'll see a Proxy Secret.
-    Set PROXY_SECRET env var with that value and this dependency will validate it.
+    Set PROXY_SECRET env var with that value and this middleware will validate it.
+    Done here rather than via Depends() so the check runs once per request
+    without a pass through FastAPI's dependency resolver.
     """
-    if PROXY_SECRET:
-        if not x_rapidapi_proxy_secret:
-            raise HTTPException(status_code=401, detail="Missing X-RapidAPI-Proxy-Secret header")
-        if x_rapidapi_proxy_secret != PROXY_SECRET:
-            raise HTTPException(status_code=401, detail="Invalid X-RapidAPI-Proxy-Secret header")
+    if PROXY_SECRET and request.url.path not in _OPEN_PATHS:
+        supplied = request.headers.get("x-rapidapi-proxy-secret")
+        # Compare as bytes: compare_digest rejects non-ASCII str, and header
+        # values arrive latin-1 decoded, so arbitrary client bytes are possible.
+        if not (
+            supplied
+            and hmac.compare_digest(supplied.encode("latin-1"), PROXY_SECRET.encode("latin-1"))
+        ):
+            return ORJSONResponse(
+                {"detail": "Missing or invalid X-RapidAPI-Proxy-Secret header"},
+                status_code=401,
+            )
     # If PROXY_SECRET is not set, allow all.
+    return await call_next(request)
 
 
 # -----------------------------
@@ -322,23 +351,98 @@ LOCALE_FLAVOR = {
     "SG": {"politeness": ["Appreciate your advice."], "greetings": ["Hope you’re well."]},
 }
 
+# The phrase banks are never mutated at runtime: freeze the lists into tuples
+# (cheaper to choose from, no overallocation) and the outer dicts into
+# read-only mappings so accidental mutation fails loudly.
+SIGN_OFF = MappingProxyType({m: tuple(v) for m, v in SIGN_OFF.items()})
+OPENERS = MappingProxyType({t: tuple(v) for t, v in OPENERS.items()})
+# Fully keyed over Tone so lookups never hit a fallback path.
+EMAIL_SUBJECT_PREFIX = MappingProxyType(
+    {t: tuple(EMAIL_SUBJECT_PREFIX.get(t, ("Update:",))) for t in get_args(Tone)}
+)
+LOCALE_FLAVOR = MappingProxyType(
+    {loc: MappingProxyType({k: tuple(v) for k, v in flavor.items()}) for loc, flavor in LOCALE_FLAVOR.items()}
+)
+
+def _make_picker(items: Sequence[str]) -> Callable[[random.Random], str]:
+    """Bind a phrase tuple into a closure so a draw is one call — no dict hit,
+    no emptiness branch on the hot path."""
+    t = tuple(items)
+    if not t:
+        return lambda rng: ""
+    return lambda rng: rng.choice(t)
+
+
+# Resolve the opener/greeting/politeness/sign-off lookups for every
+# (tone, medium, locale) combination once, so compose_message does a single
+# dict hit instead of a chain of .get() calls per variant.
+PER_CONFIG = {
+    (tone, medium, locale): (
+        _make_picker(OPENERS[tone]),
+        _make_picker(LOCALE_FLAVOR[locale].get("greetings", ())),
+        _make_picker(LOCALE_FLAVOR[locale].get("politeness", ())),
+        _make_picker(SIGN_OFF.get(medium, ("",))),
+    )
+    for tone in get_args(Tone)
+    for medium in get_args(Medium)
+    for locale in get_args(Locale)
+}
+
+SUBJECT_PREFIX_FUNCS = {t: _make_picker(v) for t, v in EMAIL_SUBJECT_PREFIX.items()}
+
+
+# Compile once at import so the hot paths skip re's per-call cache lookups.
+# Each level is fused into a single alternation so applying it is one pass
+# over the text instead of one pass per pattern.
+def _fuse_level(lvl: dict) -> tuple:
+    pats = list(lvl.items())
+    if not pats:
+        return None, []
+    fused = re.compile(
+        "|".join(rf"(?P<g{i}>\b{pat}\b)" for i, (pat, _) in enumerate(pats)),
+        re.IGNORECASE,
+    )
+    return fused, [rep for _, rep in pats]
 
-def pick(items: List[str]) -> str:
-    return random.choice(items) if items else ""
+
+def _split_level(lvl: dict) -> tuple:
+    """Partition a level into plain whole-word swaps (handled by a tokenize +
+    dict-lookup pass) and real regex patterns (phrases, lookaheads, `?`)."""
+    simple = {}
+    complex_pats = {}
+    for pat, rep in lvl.items():
+        if pat.isalpha():
+            simple[pat.lower()] = rep
+        else:
+            complex_pats[pat] = rep
+    return simple, _fuse_level(complex_pats)
+
+
+BUZZWORD_TIERS = [_split_level(lvl) for lvl in BUZZWORD_MAP_LEVELS]
+
+_TOKEN_SPLIT = re.compile(r"(\W+)")
+
+_SPLIT = re.compile(r"\n|;|\s-\s")
+_SUBJ_LEAD = re.compile(r"^[-•\s]+")
+_SUBJ_TRAIL = re.compile(r"\.$")
 
 
 def to_bullets(text: str) -> List[str]:
-    # Split on newlines or ";" or "- " and clean
-    raw = re.split(r"\n|;|\s-\s", text)
+    # Split on newlines or ";" or "- " and clean. Newline-only input (the
+    # common case) takes the C-level str.split path and skips the regex.
+    # Any "-" falls back to the regex, since \s-\s also matches dashes
+    # surrounded by tabs/newlines that a " - " check would miss.
+    if ";" not in text and "-" not in text:
+        raw = text.split("\n")
+    else:
+        raw = _SPLIT.split(text)
     bullets = [x.strip(" -*\t") for x in raw if x and x.strip()]
-    # De-duplicate while preserving order
-    seen = set()
-    deduped = []
+    # De-duplicate while preserving order (dicts keep insertion order, and
+    # setdefault hashes each key once instead of testing + adding a set)
+    seen: dict = {}
     for b in bullets:
-        if b.lower() not in seen:
-            seen.add(b.lower())
-            deduped.append(b)
-    return deduped[:8]
+        seen.setdefault(b.lower(), b)
+    return list(seen.values())[:8]
 
 
 def apply_buzzwords(s: str, intensity: int) -> str:
@@ -346,22 +450,52 @@ def apply_buzzwords(s: str, intensity: int) -> str:
         return s
     out = s
     for lvl in range(1, intensity + 1):
-        for pat, rep in BUZZWORD_MAP_LEVELS[lvl].items():
-            out = re.sub(rf"\b{pat}\b", rep, out, flags=re.IGNORECASE)
+        simple, (fused, repls) = BUZZWORD_TIERS[lvl]
+        if simple:
+            # Even slots are word chunks, odd slots the separators between them.
+            tokens = _TOKEN_SPLIT.split(out)
+            tokens[::2] = [simple.get(t.lower(), t) for t in tokens[::2]]
+            out = "".join(tokens)
+        if fused is not None:
+            out = fused.sub(lambda m: repls[int(m.lastgroup[1:])], out)
     return out
 
 
-def make_subject(tone: Tone, bullets: List[str]) -> str:
-    prefix = pick(EMAIL_SUBJECT_PREFIX.get(tone, ["Update:"]))
+def make_subject(tone: Tone, bullets: Sequence[str], rng: random.Random) -> str:
+    prefix = SUBJECT_PREFIX_FUNCS[tone](rng)
     core = bullets[0] if bullets else "Update"
     # Keep it concise
-    core = re.sub(r"^[-•\s]+", "", core)
-    core = re.sub(r"\.$", "", core)
+    core = _SUBJ_LEAD.sub("", core)
+    core = _SUBJ_TRAIL.sub("", core)
     return f"{prefix} {core[:72]}".strip()
 
 
-def sign_off(medium: Medium) -> str:
-    return pick(SIGN_OFF.get(medium, [""]))
+def _precompute_parts(text: str, length: Length) -> tuple:
+    """Deterministic part of compose_message: bullets, bullet block, core line.
+
+    Split out so repeated calls for the same input (the suggestions loop, or
+    callers re-polishing the same text) can be served from the cache below.
+    """
+    bullets = tuple(to_bullets(text))
+    bullet_block = "\n".join(f"• {b}" for b in bullets[:5])
+
+    # Single-line summary
+    summary = " ".join(bullets[:2]) if bullets else text
+    if length == "short":
+        core = f"{summary}."
+    elif length == "medium":
+        core = (
+            f"{summary}. Requesting your input on the above so we can proceed without delay."
+        )
+    else:  # long
+        core = (
+            f"{summary}. Here's the context: {', '.join(bullets[2:5]) if len(bullets)>2 else 'see above'}. "
+            f"Next steps: we'll align on owners & timelines after your feedback."
+        )
+    return bullets, bullet_block, core
+
+
+_precompute_parts_cached = functools.lru_cache(maxsize=1024)(_precompute_parts)
 
 
 def compose_message(
@@ -372,13 +506,20 @@ def compose_message(
     locale: Locale,
     include_bullets: bool,
     add_subject: bool,
+    rng: random.Random,
 ) -> MessageVariant:
-    bullets = to_bullets(text)
-    opener = pick(OPENERS[tone])
+    # Nothing to polish — skip the whole pipeline.
+    if not text or not text.strip():
+        return MessageVariant(subject=None, message="")
 
-    locale_bits = LOCALE_FLAVOR.get(locale, LOCALE_FLAVOR["Generic"])
-    greeting = pick(locale_bits.get("greetings", []))
-    politeness = pick(locale_bits.get("politeness", []))
+    # Keep huge payloads out of the cache so 1024 entries stay cheap to hold.
+    precompute = _precompute_parts_cached if len(text) < 4096 else _precompute_parts
+    bullets, bullet_block, core = precompute(text, length)
+
+    pick_opener, pick_greeting, pick_politeness, pick_sign_off = PER_CONFIG[(tone, medium, locale)]
+    opener = pick_opener(rng)
+    greeting = pick_greeting(rng)
+    politeness = pick_politeness(rng)
 
     # Body assembly
     body_parts: List[str] = []
@@ -391,34 +532,22 @@ def compose_message(
 
     # Bullet summary if requested or if executive tone with medium email/doc
     if include_bullets or (tone == "executive" and medium in ("email", "doc")):
-        if bullets:
-            body_parts.append("\n".join([f"• {b}" for b in bullets[:5]]))
+        if bullet_block:
+            body_parts.append(bullet_block)
 
-    # Single-line summary
-    summary = " ".join(bullets[:2]) if bullets else text
-    if length == "short":
-        core = f"{summary}."
-    elif length == "medium":
-        core = (
-            f"{summary}. Requesting your input on the above so we can proceed without delay."
-        )
-    else:  # long
-        core = (
-            f"{summary}. Here's the context: {', '.join(bullets[2:5]) if len(bullets)>2 else 'see above'}. "
-            f"Next steps: we'll align on owners & timelines after your feedback."
-        )
     body_parts.append(core)
 
     if politeness:
         body_parts.append(politeness)
 
-    s_off = sign_off(medium)
+    s_off = pick_sign_off(rng)
     if s_off:
         body_parts.append(s_off)
 
-    msg = "\n\n".join([p for p in body_parts if p])
+    # Every append above is guarded, so no filtering pass is needed here.
+    msg = "\n\n".join(body_parts)
 
-    subj = make_subject(tone, bullets) if (medium == "email" and add_subject) else None
+    subj = make_subject(tone, bullets, rng) if (medium == "email" and add_subject) else None
     return MessageVariant(subject=subj, message=msg)
 
 
@@ -426,7 +555,7 @@ def compose_message(
 # Endpoints
 # -----------------------------
 @app.get("/", tags=["meta"]) 
-def root():
+async def root():
     return {
         "name": API_TITLE,
         "version": "1.0.0",
@@ -436,14 +565,21 @@ def root():
 
 
 @app.get("/health", tags=["meta"]) 
-def health():
+async def health():
     return {"status": "ok"}
 
 
-@app.post("/polish", response_model=PolishResponse, tags=["compose"], dependencies=[Depends(require_proxy_secret)])
+# response_model is left off on purpose: we build the payload ourselves, so
+# the outgoing Pydantic validation pass would be pure overhead. The schema
+# still shows up in the docs via `responses`.
+@app.post("/polish", responses={200: {"model": PolishResponse}}, tags=["compose"])
 def polish(req: PolishRequest):
     """Return multiple polished variants according to tone/medium/length/locale."""
-    random.seed(len(req.text) + req.suggestions)  # stable-ish randomness
+    if not req.text.strip():
+        raise HTTPException(status_code=400, detail="text must not be empty or whitespace")
+    # Stable-ish randomness, local to this request so concurrent workers
+    # never stomp on shared global RNG state.
+    rng = random.Random(len(req.text) + req.suggestions)
     variants: List[MessageVariant] = []
     for _ in range(req.suggestions):
         v = compose_message(
@@ -454,16 +590,17 @@ def polish(req: PolishRequest):
             locale=req.locale,
             include_bullets=req.include_bullets,
             add_subject=req.add_subject,
+            rng=rng,
         )
         # Add slight variation by applying buzzwords lightly for some variants
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             v.message = apply_buzzwords(v.message, 1)
             if v.subject:
                 v.subject = apply_buzzwords(v.subject, 1)
         variants.append(v)
 
-    return {
-        "variants": variants,
+    return ORJSONResponse({
+        "variants": [v.model_dump() for v in variants],
         "meta": {
             "tone": req.tone,
             "medium": req.medium,
@@ -471,83 +608,88 @@ def polish(req: PolishRequest):
             "locale": req.locale,
             "suggestions": req.suggestions,
         },
-    }
+    })
 
 
-@app.post("/buzzwordify", response_model=BuzzwordifyResponse, tags=["transform"], dependencies=[Depends(require_proxy_secret)])
+@app.post("/buzzwordify", response_model=BuzzwordifyResponse, tags=["transform"])
 def buzzwordify(req: BuzzwordifyRequest):
     transformed = apply_buzzwords(req.text, req.intensity)
     return {"original": req.text, "transformed": transformed}
 
 
-@app.post("/reply-suggestions", response_model=ReplySuggestionsResponse, tags=["compose"], dependencies=[Depends(require_proxy_secret)])
+REPLY_STYLES = {
+    "neutral": [
+        "Thanks for the update—got it.",
+        "Acknowledged. I’ll keep you posted.",
+        "Noted, thanks.",
+    ],
+    "positive": [
+        "This looks great—thanks for pushing it forward!",
+        "Nice progress—appreciate the momentum.",
+        "Awesome—thanks for the clarity!",
+    ],
+    "pushback": [
+        "Thanks—timeline is tight. Can we prioritize the critical path and revisit the rest next sprint?",
+        "Appreciate it. Given constraints, proposing we de-scope X to hit the target date—thoughts?",
+        "Understood. For feasibility, can we align on the must-haves first?",
+    ],
+    "clarify": [
+        "Thanks—could you clarify the owner for the next step?",
+        "Helpful. What’s the expected date for the handoff?",
+        "Got it—what’s the definition of done here?",
+    ],
+    "acknowledge": [
+        "Received, thanks.",
+        "Acknowledged—will do.",
+        "Noted—appreciate it.",
+    ],
+}
+
+# Both medium variants are precomputed so the handler only slices.
+STYLE_MAP_DEFAULT = {k: tuple(v) for k, v in REPLY_STYLES.items()}
+STYLE_MAP_HYPHEN = {k: tuple(r.replace("—", " - ") for r in v) for k, v in REPLY_STYLES.items()}
+
+
+@app.post("/reply-suggestions", response_model=ReplySuggestionsResponse, tags=["compose"])
 def reply_suggestions(req: ReplySuggestionsRequest):
-    style_map = {
-        "neutral": [
-            "Thanks for the update—got it.",
-            "Acknowledged. I’ll keep you posted.",
-            "Noted, thanks.",
-        ],
-        "positive": [
-            "This looks great—thanks for pushing it forward!",
-            "Nice progress—appreciate the momentum.",
-            "Awesome—thanks for the clarity!",
-        ],
-        "pushback": [
-            "Thanks—timeline is tight. Can we prioritize the critical path and revisit the rest next sprint?",
-            "Appreciate it. Given constraints, proposing we de-scope X to hit the target date—thoughts?",
-            "Understood. For feasibility, can we align on the must-haves first?",
-        ],
-        "clarify": [
-            "Thanks—could you clarify the owner for the next step?",
-            "Helpful. What’s the expected date for the handoff?",
-            "Got it—what’s the definition of done here?",
-        ],
-        "acknowledge": [
-            "Received, thanks.",
-            "Acknowledged—will do.",
-            "Noted—appreciate it.",
-        ],
-    }
+    # Medium-savvy tweaks (em-dashes read oddly in Slack/Teams)
+    table = STYLE_MAP_HYPHEN if req.medium in ("slack", "teams") else STYLE_MAP_DEFAULT
+    base = table.get(req.style, table["neutral"])
+    return {"replies": list(base[: min(req.suggestions, len(base))])}
 
-    base = style_map.get(req.style, style_map["neutral"])
-    n = min(req.suggestions, len(base))
-    replies = base[:n]
 
-    # Medium-savvy tweaks
-    if req.medium in ("slack", "teams"):
-        replies = [r.replace("—", " - ") for r in replies]
-    return {"replies": replies}
+PHRASE_BANK = {
+    "one_on_one": [
+        "Agenda: updates, blockers, next sprint priorities.",
+        "I’d appreciate feedback on X and growth areas.",
+        "What would make the biggest impact if I focused on it this week?",
+    ],
+    "status": [
+        "Green on scope; amber on timeline; risk on dependency Y.",
+        "On track overall; one risk identified—mitigation in progress.",
+        "Blocked on approval; ETA slips by 2 days without decision.",
+    ],
+    "follow_up": [
+        "Looping back on the below—any update?",
+        "Gentle nudge in case this got buried.",
+        "Re-surfacing this for visibility—appreciate a quick look.",
+    ],
+    "wfh": [
+        "Requesting WFH on <dates>—deliverables unaffected.",
+        "WFH next week due to personal commitment; coverage planned.",
+        "Seeking approval for remote work on <date>; meetings unaffected.",
+    ],
+}
 
+# The phrase bank is static, so serialize it once at import and hand the
+# prebuilt bytes straight to the response — no per-request encoding.
+_PHRASES_FULL = orjson.dumps(PHRASE_BANK)
+_PHRASES_CTX = {k: orjson.dumps({k: v}) for k, v in PHRASE_BANK.items()}
 
-@app.get("/phrases", tags=["reference"], dependencies=[Depends(require_proxy_secret)])
-def phrases(context: Optional[str] = Query(default=None, description="e.g., 'one_on_one', 'status', 'follow_up'")):
-    base = {
-        "one_on_one": [
-            "Agenda: updates, blockers, next sprint priorities.",
-            "I’d appreciate feedback on X and growth areas.",
-            "What would make the biggest impact if I focused on it this week?",
-        ],
-        "status": [
-            "Green on scope; amber on timeline; risk on dependency Y.",
-            "On track overall; one risk identified—mitigation in progress.",
-            "Blocked on approval; ETA slips by 2 days without decision.",
-        ],
-        "follow_up": [
-            "Looping back on the below—any update?",
-            "Gentle nudge in case this got buried.",
-            "Re-surfacing this for visibility—appreciate a quick look.",
-        ],
-        "wfh": [
-            "Requesting WFH on <dates>—deliverables unaffected.",
-            "WFH next week due to personal commitment; coverage planned.",
-            "Seeking approval for remote work on <date>; meetings unaffected.",
-        ],
-    }
 
-    if context and context in base:
-        return {context: base[context]}
-    return base
+@app.get("/phrases", tags=["reference"])
+async def phrases(context: Optional[str] = Query(default=None, description="e.g., 'one_on_one', 'status', 'follow_up'")):
+    return Response(content=_PHRASES_CTX.get(context, _PHRASES_FULL), media_type="application/json")
 
 
 # ------------- End of file -------------